@@ -1,4 +1,14 @@
-from django.contrib import admin
+import hashlib
+
+from admin_auto_filters.filters import AutocompleteFilterFactory
+from django.contrib import admin, messages
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import OperationalError, connection, transaction
+from django.db.models import Case, Count, F, IntegerField, When, Window
+from django.db.models.functions import RowNumber
+from django.utils.functional import cached_property
 from .models import (
     Course, Module, Lesson, UserProgress, CourseEnrollment, Exam, ExamAttempt, Certification,
     Cohort, CohortMember, Bundle, BundlePurchase, CourseAccess, CoursePurchase, GiftPurchase,
@@ -12,19 +22,106 @@ from .models import (
 )
 
 
+class TimeoutPaginator(Paginator):
+    """Paginator whose COUNT(*) is bounded by a statement timeout.
+
+    On big tables (purchases, bookings, progress rows) the exact count the
+    admin runs for every change-list page becomes the dominant cost. Give
+    the count 200ms; if it times out, return a large sentinel so pagination
+    still works. Small tables stay exact, and non-Postgres backends fall
+    back to the normal count.
+    """
+    COUNT_TIMEOUT_MS = 200
+    COUNT_SENTINEL = 9999999999
+
+    @cached_property
+    def count(self):
+        if connection.vendor != 'postgresql':
+            return super().count
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute('SET LOCAL statement_timeout TO %s', [self.COUNT_TIMEOUT_MS])
+                return super().count
+        except OperationalError:
+            return self.COUNT_SENTINEL
+
+
+class CachedChangeListMixin:
+    """Cache rendered change-list responses for read-mostly admins.
+
+    Responses are keyed per session and query string plus a per-model
+    generation counter; saves and deletes bump the counter (via signals
+    registered in _register_changelist_invalidation), so stale pages are
+    never served after a write. Session-keyed (not user-keyed) so two
+    concurrent sessions never see each other's cookie/CSRF material.
+    """
+    changelist_cache_timeout = 60
+
+    @staticmethod
+    def _generation_key(opts):
+        return f'admin_changelist_gen:{opts.label_lower}'
+
+    def changelist_view(self, request, extra_context=None):
+        if request.method != 'GET':
+            return super().changelist_view(request, extra_context)
+        generation = cache.get(self._generation_key(self.opts), 0)
+        path_hash = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        cache_key = f'admin_changelist:{self.opts.label_lower}:{generation}:{request.session.session_key}:{path_hash}'
+        response = cache.get(cache_key)
+        if response is None:
+            # One-time messages (e.g. the "changed successfully" banner on the
+            # post-save redirect) render into the page; caching that response
+            # would replay the banner on every hit until the TTL expires
+            has_pending_messages = bool(messages.get_messages(request))
+            response = super().changelist_view(request, extra_context)
+            if hasattr(response, 'render'):
+                response.render()
+            if (
+                response.status_code == 200
+                and not has_pending_messages
+                and not response.has_header('Set-Cookie')
+            ):
+                cache.set(cache_key, response, self.changelist_cache_timeout)
+        return response
+
+
+def _register_changelist_invalidation(*models):
+    """Bump the cached change-list generation whenever a model is written."""
+    from django.db.models.signals import post_delete, post_save
+
+    def _bump(sender, **kwargs):
+        key = CachedChangeListMixin._generation_key(sender._meta)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+    for model in models:
+        post_save.connect(_bump, sender=model, weak=False)
+        post_delete.connect(_bump, sender=model, weak=False)
+
+
 @admin.register(Course)
-class CourseAdmin(admin.ModelAdmin):
-    list_display = ['name', 'course_type', 'delivery_type', 'status', 'coach_name', 'is_paid', 'price', 'currency', 'is_subscribers_only', 'created_at']
+class CourseAdmin(CachedChangeListMixin, admin.ModelAdmin):
+    list_display = ('name', 'course_type', 'delivery_type', 'status', 'coach_name', 'is_paid', 'price', 'currency', 'is_subscribers_only', 'created_at')
+
+    def get_queryset(self, request):
+        # The change list never renders the wide text/JSON columns. No M2M
+        # prefetch here: the list does not show teachers/prerequisites, and
+        # the autocomplete edit form fetches its selected values on its own.
+        return super().get_queryset(request).defer(
+            'description', 'certificate_field_positions',
+        )
 
     def formfield_for_manytomany(self, db_field, request, **kwargs):
         if db_field.name == 'teachers':
             from .utils.teacher import get_eligible_course_teacher_users
             kwargs['queryset'] = get_eligible_course_teacher_users()
         return super().formfield_for_manytomany(db_field, request, **kwargs)
-    list_filter = ['course_type', 'delivery_type', 'status', 'is_paid', 'is_subscribers_only', 'is_accredible_certified']
+    list_filter = ('course_type', 'delivery_type', 'status', 'is_paid', 'is_subscribers_only', 'is_accredible_certified')
     search_fields = ['name', 'description']
     prepopulated_fields = {'slug': ('name',)}
-    filter_horizontal = ['teachers', 'prerequisite_courses']
+    autocomplete_fields = ['teachers', 'prerequisite_courses']
     fieldsets = (
         ('Basic Information', {
             'fields': ('name', 'slug', 'course_type', 'status', 'short_description', 'description')
@@ -44,23 +141,51 @@ class CourseAdmin(admin.ModelAdmin):
         ('Features', {
             'fields': ('is_subscribers_only', 'is_accredible_certified', 'has_asset_templates', 'exam_unlock_days', 'special_tag')
         }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at')
+        }),
     )
+    readonly_fields = ('created_at', 'updated_at')
 
 
 @admin.register(Module)
 class ModuleAdmin(admin.ModelAdmin):
-    list_display = ['name', 'course', 'order']
-    list_filter = ['course']
+    list_display = ('name', 'course', 'order')
+    list_filter = (AutocompleteFilterFactory('Course', 'course'),)
+    list_select_related = ('course',)
     ordering = ['course', 'order']
 
 
 @admin.register(Lesson)
 class LessonAdmin(admin.ModelAdmin):
-    list_display = ['title', 'course', 'module', 'order', 'lesson_type', 'video_duration', 'ai_generation_status']
-    list_filter = ['course', 'lesson_type', 'ai_generation_status']
+    list_display = ('title', 'course', 'module', 'order', 'lesson_type', 'duration', 'ai_generation_status')
+    list_filter = (AutocompleteFilterFactory('Course', 'course'), 'lesson_type', 'ai_generation_status')
     search_fields = ['title', 'description', 'working_title', 'vimeo_id']
     prepopulated_fields = {'slug': ('title',)}
+    list_select_related = ('course', 'module')
     ordering = ['course', 'order']
+
+    def get_queryset(self, request):
+        # Skip the KB-scale text/JSON columns the change list never shows,
+        # and resolve the Vimeo-or-manual duration fallback in SQL so the
+        # column sorts correctly.
+        return super().get_queryset(request).defer(
+            'description', 'rough_notes', 'transcription', 'transcription_error',
+            'ai_short_summary', 'ai_full_description', 'ai_outcomes',
+            'ai_coach_actions', 'content', 'ai_chatbot_training_error',
+        ).annotate(
+            _duration_seconds=Case(
+                When(vimeo_duration_seconds__gt=0, then=F('vimeo_duration_seconds')),
+                default=F('video_duration') * 60,
+                output_field=IntegerField(),
+            )
+        )
+
+    def duration(self, obj):
+        seconds = obj._duration_seconds or 0
+        return f"{seconds // 60}:{seconds % 60:02d}"
+    duration.short_description = 'Duration'
+    duration.admin_order_field = '_duration_seconds'
     fieldsets = (
         ('Basic Information', {
             'fields': ('course', 'module', 'title', 'slug', 'order', 'lesson_type')
@@ -77,96 +202,151 @@ class LessonAdmin(admin.ModelAdmin):
         ('Resources', {
             'fields': ('description', 'workbook_url', 'resources_url')
         }),
+        ('Timestamps', {
+            'fields': ('created_at',)
+        }),
     )
+    readonly_fields = ('created_at',)
 
 
 @admin.register(UserProgress)
 class UserProgressAdmin(admin.ModelAdmin):
-    list_display = ['user', 'lesson', 'status', 'completed', 'video_watch_percentage', 'progress_percentage', 'last_accessed']
-    list_filter = ['status', 'completed', 'last_accessed']
+    list_display = ('user', 'lesson', 'status', 'completed', 'video_watch_percentage', 'progress_percentage', 'last_accessed')
+    list_filter = ('status', 'completed', 'last_accessed')
     search_fields = ['user__username', 'lesson__title']
+    list_select_related = ('user', 'lesson', 'lesson__course')
     readonly_fields = ['last_accessed', 'started_at', 'completed_at']
+    paginator = TimeoutPaginator
+    show_full_result_count = False
 
 
 @admin.register(CourseEnrollment)
 class CourseEnrollmentAdmin(admin.ModelAdmin):
-    list_display = ['user', 'course', 'payment_type', 'enrolled_at']
-    list_filter = ['payment_type', 'enrolled_at']
+    list_display = ('user', 'course', 'payment_type', 'enrolled_at')
+    list_filter = ('payment_type', 'enrolled_at')
     search_fields = ['user__username', 'course__name']
+    list_select_related = ('user', 'course')
 
 
 @admin.register(Exam)
 class ExamAdmin(admin.ModelAdmin):
-    list_display = ['course', 'title', 'passing_score', 'max_attempts', 'is_active']
-    list_filter = ['is_active']
+    list_display = ('course', 'title', 'passing_score', 'max_attempts', 'is_active')
+    list_filter = ('is_active',)
     search_fields = ['course__name', 'title']
+    list_select_related = ('course',)
 
 
 @admin.register(ExamAttempt)
 class ExamAttemptAdmin(admin.ModelAdmin):
-    list_display = ['user', 'exam', 'score', 'passed', 'started_at', 'completed_at', 'attempt_number']
-    list_filter = ['passed', 'started_at', 'exam']
+    list_display = ('user', 'exam', 'score', 'passed', 'started_at', 'completed_at', 'attempt_number')
+    list_filter = ('passed', 'started_at', 'exam')
     search_fields = ['user__username', 'exam__course__name']
+    list_select_related = ('user', 'exam', 'exam__course')
     readonly_fields = ['started_at', 'attempt_number']
-    
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _attempt_number=Window(
+                expression=RowNumber(),
+                partition_by=[F('user'), F('exam')],
+                order_by=F('started_at').asc(),
+            )
+        )
+
     def attempt_number(self, obj):
-        return obj.attempt_number()
+        return obj._attempt_number
     attempt_number.short_description = 'Attempt #'
+    attempt_number.admin_order_field = '_attempt_number'
 
 
 @admin.register(Certification)
 class CertificationAdmin(admin.ModelAdmin):
-    list_display = ['user', 'course', 'status', 'issued_at', 'accredible_certificate_id']
-    list_filter = ['status', 'issued_at']
+    list_display = ('user', 'course', 'status', 'issued_at', 'accredible_certificate_id')
+    list_filter = ('status', 'issued_at')
     search_fields = ['user__username', 'course__name', 'accredible_certificate_id']
+    list_select_related = ('user', 'course')
     readonly_fields = ['created_at', 'updated_at']
+    show_full_result_count = False
 
 
 # ========== ACCESS CONTROL ADMIN ==========
 
 @admin.register(Cohort)
 class CohortAdmin(admin.ModelAdmin):
-    list_display = ['name', 'is_active', 'get_member_count', 'created_at']
-    list_filter = ['is_active', 'created_at']
+    list_display = ('name', 'is_active', 'get_member_count', 'created_at')
+    list_filter = ('is_active', 'created_at')
     search_fields = ['name', 'description']
     readonly_fields = ['created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_member_count=Count('members'))
+
+    def get_member_count(self, obj):
+        return obj._member_count
+    get_member_count.short_description = 'Members'
+    get_member_count.admin_order_field = '_member_count'
+
 
 @admin.register(CohortMember)
 class CohortMemberAdmin(admin.ModelAdmin):
-    list_display = ['user', 'cohort', 'joined_at', 'remove_access_on_leave']
-    list_filter = ['cohort', 'joined_at', 'remove_access_on_leave']
+    list_display = ('user', 'cohort', 'joined_at', 'remove_access_on_leave')
+    list_filter = ('cohort', 'joined_at', 'remove_access_on_leave')
     search_fields = ['user__username', 'cohort__name']
+    list_select_related = ('user', 'cohort')
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Keep the edit-page widgets to single slim SELECTs.
+        if db_field.name == 'user':
+            kwargs['queryset'] = User.objects.only('id', 'username')
+        elif db_field.name == 'cohort':
+            kwargs['queryset'] = Cohort.objects.only('id', 'name')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
 @admin.register(Bundle)
-class BundleAdmin(admin.ModelAdmin):
-    list_display = ['name', 'bundle_type', 'is_active', 'price', 'get_course_count', 'created_at']
-    list_filter = ['bundle_type', 'is_active', 'created_at']
+class BundleAdmin(CachedChangeListMixin, admin.ModelAdmin):
+    list_display = ('name', 'bundle_type', 'is_active', 'price', 'get_course_count', 'created_at')
+    list_filter = ('bundle_type', 'is_active', 'created_at')
     search_fields = ['name', 'description']
     prepopulated_fields = {'slug': ('name',)}
-    filter_horizontal = ['courses']
-    
+    autocomplete_fields = ['courses']
+    readonly_fields = ('created_at', 'updated_at')
+
+    def get_queryset(self, request):
+        # Count stays an annotation; prefetching the wide Course rows would
+        # materialize every course per bundle on a list that never shows them
+        return super().get_queryset(request).annotate(_course_count=Count('courses'))
+
     def get_course_count(self, obj):
-        return obj.courses.count()
+        return obj._course_count
     get_course_count.short_description = 'Courses'
+    get_course_count.admin_order_field = '_course_count'
 
 
 @admin.register(BundlePurchase)
 class BundlePurchaseAdmin(admin.ModelAdmin):
-    list_display = ['user', 'bundle', 'purchase_id', 'purchase_date']
-    list_filter = ['bundle', 'purchase_date']
+    list_display = ('user', 'bundle', 'purchase_id', 'purchase_date')
+    list_filter = ('bundle', 'purchase_date')
     search_fields = ['user__username', 'bundle__name', 'purchase_id']
-    filter_horizontal = ['selected_courses']
+    list_select_related = ('user', 'bundle')
+    autocomplete_fields = ['user', 'bundle', 'selected_courses']
     readonly_fields = ['purchase_date']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('selected_courses')
+
 
 @admin.register(CoursePurchase)
 class CoursePurchaseAdmin(admin.ModelAdmin):
-    list_display = ['user', 'course', 'amount', 'currency', 'status', 'provider', 'paid_at', 'created_at']
-    list_filter = ['status', 'provider', 'currency', 'paid_at', 'created_at']
+    list_display = ('user', 'course', 'amount', 'currency', 'status', 'provider', 'paid_at', 'created_at')
+    list_filter = ('status', 'provider', 'currency', 'paid_at', 'created_at')
     search_fields = ['user__username', 'course__name', 'provider_id', 'provider']
+    list_select_related = ('user', 'course')
+    autocomplete_fields = ['user', 'course']
     readonly_fields = ['created_at', 'paid_at']
+    paginator = TimeoutPaginator
+    show_full_result_count = False
     fieldsets = (
         ('Purchase Information', {
             'fields': ('user', 'course', 'amount', 'currency', 'status')
@@ -185,10 +365,17 @@ class CoursePurchaseAdmin(admin.ModelAdmin):
 
 @admin.register(CourseAccess)
 class CourseAccessAdmin(admin.ModelAdmin):
-    list_display = ['user', 'course', 'access_type', 'status', 'get_source', 'granted_at', 'expires_at']
-    list_filter = ['access_type', 'status', 'granted_at', 'expires_at']
+    list_display = ('user', 'course', 'access_type', 'status', 'get_source', 'granted_at', 'expires_at')
+    list_filter = ('access_type', 'status', 'granted_at', 'expires_at')
     search_fields = ['user__username', 'course__name', 'purchase_id']
+    # bundle_purchase__bundle is included because get_source_display()
+    # renders the bundle name; without it the Source column costs one
+    # bundle query per row.
+    list_select_related = ('user', 'course', 'bundle_purchase', 'bundle_purchase__bundle', 'course_purchase', 'cohort', 'granted_by')
+    autocomplete_fields = ['user', 'course', 'granted_by', 'revoked_by']
     readonly_fields = ['granted_at', 'revoked_at']
+    paginator = TimeoutPaginator
+    show_full_result_count = False
     fieldsets = (
         ('Access Information', {
             'fields': ('user', 'course', 'access_type', 'status')
@@ -210,31 +397,45 @@ class CourseAccessAdmin(admin.ModelAdmin):
 
 
 @admin.register(LearningPath)
-class LearningPathAdmin(admin.ModelAdmin):
-    list_display = ['name', 'is_active', 'get_course_count', 'created_at']
-    list_filter = ['is_active', 'created_at']
+class LearningPathAdmin(CachedChangeListMixin, admin.ModelAdmin):
+    list_display = ('name', 'is_active', 'get_course_count', 'created_at')
+    list_filter = ('is_active', 'created_at')
     search_fields = ['name', 'description']
-    
+    readonly_fields = ('created_at',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_course_count=Count('courses'))
+
     def get_course_count(self, obj):
-        return obj.courses.count()
+        return obj._course_count
     get_course_count.short_description = 'Courses'
+    get_course_count.admin_order_field = '_course_count'
 
 
 @admin.register(LearningPathCourse)
 class LearningPathCourseAdmin(admin.ModelAdmin):
-    list_display = ['learning_path', 'course', 'order', 'is_required']
-    list_filter = ['learning_path', 'is_required']
+    list_display = ('learning_path', 'course', 'order', 'is_required')
+    list_filter = ('learning_path', 'is_required')
     search_fields = ['learning_path__name', 'course__name']
+    list_select_related = ('learning_path', 'course')
     ordering = ['learning_path', 'order']
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'learning_path':
+            kwargs['queryset'] = LearningPath.objects.only('id', 'name')
+        elif db_field.name == 'course':
+            kwargs['queryset'] = Course.objects.only('id', 'name')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 # ========== TEACHER & LIVE SESSIONS ADMIN ==========
 
 @admin.register(LiveSession)
 class LiveSessionAdmin(admin.ModelAdmin):
-    list_display = ['title', 'course', 'scheduled_at', 'duration_minutes', 'status', 'get_bookings_count', 'capacity', 'created_at']
-    list_filter = ['status', 'scheduled_at', 'course']
+    list_display = ('title', 'course', 'scheduled_at', 'duration_minutes', 'status', 'get_bookings_count', 'capacity', 'created_at')
+    list_filter = ('status', 'scheduled_at', AutocompleteFilterFactory('Course', 'course'))
     search_fields = ['title', 'description', 'course__name']
+    list_select_related = ('course',)
     readonly_fields = ['created_at', 'updated_at']
     fieldsets = (
         ('Session Information', {
@@ -251,17 +452,25 @@ class LiveSessionAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).defer('description', 'notes')
+        return qs.annotate(_bookings_count=Count('bookings'))
+
     def get_bookings_count(self, obj):
-        return obj.get_bookings_count()
+        return obj._bookings_count
     get_bookings_count.short_description = 'Bookings'
+    get_bookings_count.admin_order_field = '_bookings_count'
 
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
-    list_display = ['user', 'session', 'status', 'attended', 'booked_at', 'attendance_marked_at', 'attendance_marked_by']
-    list_filter = ['status', 'attended', 'booked_at', 'session__course']
+    list_display = ('user', 'session', 'status', 'attended', 'booked_at', 'attendance_marked_at', 'attendance_marked_by')
+    list_filter = ('status', 'attended', 'booked_at', AutocompleteFilterFactory('Course', 'session__course'))
     search_fields = ['user__username', 'session__title', 'session__course__name']
+    list_select_related = ('user', 'session', 'session__course', 'attendance_marked_by')
     readonly_fields = ['booked_at', 'cancelled_at', 'attendance_marked_at']
+    paginator = TimeoutPaginator
+    show_full_result_count = False
     fieldsets = (
         ('Booking Information', {
             'fields': ('user', 'session', 'status', 'attended')
@@ -274,13 +483,26 @@ class BookingAdmin(admin.ModelAdmin):
         }),
     )
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name in ('user', 'attendance_marked_by'):
+            kwargs['queryset'] = User.objects.only('id', 'username')
+        elif db_field.name == 'session':
+            kwargs['queryset'] = LiveSession.objects.select_related('course').only(
+                'id', 'title', 'scheduled_at', 'course__name',
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 @admin.register(GiftPurchase)
 class GiftPurchaseAdmin(admin.ModelAdmin):
-    list_display = ['course', 'purchaser', 'recipient_email', 'recipient_name', 'status', 'created_at', 'sent_at', 'redeemed_at']
-    list_filter = ['status', 'course', 'created_at', 'sent_at', 'redeemed_at']
+    list_display = ('course', 'purchaser', 'recipient_email', 'recipient_name', 'status', 'created_at', 'sent_at', 'redeemed_at')
+    list_filter = ('status', 'course', 'created_at', 'sent_at', 'redeemed_at')
     search_fields = ['recipient_email', 'recipient_name', 'purchaser__username', 'course__name', 'gift_token']
+    list_select_related = ('course', 'purchaser')
+    autocomplete_fields = ['purchaser', 'recipient_user', 'course']
     readonly_fields = ['gift_token', 'created_at', 'sent_at', 'redeemed_at']
+    paginator = TimeoutPaginator
+    show_full_result_count = False
     fieldsets = (
         ('Gift Information', {
             'fields': ('purchaser', 'course', 'course_purchase', 'gift_token')
@@ -299,8 +521,8 @@ class GiftPurchaseAdmin(admin.ModelAdmin):
 
 @admin.register(TeacherRequest)
 class TeacherRequestAdmin(admin.ModelAdmin):
-    list_display = ['first_name', 'last_name', 'email', 'status', 'languages_spoken', 'created_at', 'reviewed_at', 'reviewed_by']
-    list_filter = ['status', 'created_at', 'reviewed_at']
+    list_display = ('first_name', 'last_name', 'email', 'status', 'languages_spoken', 'created_at', 'reviewed_at', 'reviewed_by')
+    list_filter = ('status', 'created_at', 'reviewed_at')
     search_fields = ['first_name', 'last_name', 'email', 'user__username', 'languages_spoken']
     readonly_fields = ['created_at', 'updated_at', 'reviewed_at']
     fieldsets = (
@@ -318,226 +540,234 @@ class TeacherRequestAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer(
+            'bio', 'qualifications', 'teaching_experience', 'motivation', 'admin_notes',
+        )
+
 
 @admin.register(TeacherProfile)
 class TeacherProfileAdmin(admin.ModelAdmin):
-    list_display = ['user', 'headline', 'website', 'linkedin_url', 'updated_at']
+    list_display = ('user', 'headline', 'website', 'linkedin_url', 'updated_at')
     search_fields = ['user__username', 'user__first_name', 'user__last_name', 'headline', 'bio']
     readonly_fields = ['updated_at']
 
 
 @admin.register(FeatureFlag)
 class FeatureFlagAdmin(admin.ModelAdmin):
-    list_display = ['key', 'is_enabled', 'rollout_percentage', 'updated_at']
-    list_filter = ['is_enabled']
+    list_display = ('key', 'is_enabled', 'rollout_percentage', 'updated_at')
+    list_filter = ('is_enabled',)
     search_fields = ['key', 'description']
 
 
 @admin.register(SystemSetting)
 class SystemSettingAdmin(admin.ModelAdmin):
-    list_display = ['key', 'value_type', 'updated_at', 'updated_by']
+    list_display = ('key', 'value_type', 'updated_at', 'updated_by')
     search_fields = ['key']
 
 
 @admin.register(AuditLog)
 class AuditLogAdmin(admin.ModelAdmin):
-    list_display = ['action', 'actor', 'entity_type', 'entity_id', 'created_at']
-    list_filter = ['action', 'entity_type', 'created_at']
+    list_display = ('action', 'actor', 'entity_type', 'entity_id', 'created_at')
+    list_filter = ('action', 'entity_type', 'created_at')
     search_fields = ['action', 'entity_type', 'entity_id']
     readonly_fields = ['created_at']
 
 
 @admin.register(Language)
 class LanguageAdmin(admin.ModelAdmin):
-    list_display = ['code', 'name', 'is_active', 'is_default', 'is_rtl']
-    list_filter = ['is_active', 'is_default', 'is_rtl']
+    list_display = ('code', 'name', 'is_active', 'is_default', 'is_rtl')
+    list_filter = ('is_active', 'is_default', 'is_rtl')
 
 
 @admin.register(CMSPage)
 class CMSPageAdmin(admin.ModelAdmin):
-    list_display = ['slug', 'title', 'is_published', 'updated_at', 'updated_by']
-    list_filter = ['is_published']
+    list_display = ('slug', 'title', 'is_published', 'updated_at', 'updated_by')
+    list_filter = ('is_published',)
     search_fields = ['slug', 'title']
 
 
 @admin.register(CMSPageTranslation)
 class CMSPageTranslationAdmin(admin.ModelAdmin):
-    list_display = ['page', 'language', 'updated_at']
-    list_filter = ['language']
+    list_display = ('page', 'language', 'updated_at')
+    list_filter = ('language',)
     search_fields = ['page__slug']
 
 
 @admin.register(CMSPageRevision)
 class CMSPageRevisionAdmin(admin.ModelAdmin):
-    list_display = ['page', 'editor', 'created_at', 'note']
+    list_display = ('page', 'editor', 'created_at', 'note')
     search_fields = ['page__slug', 'note']
 
 
 @admin.register(CurrencyConfig)
 class CurrencyConfigAdmin(admin.ModelAdmin):
-    list_display = ['code', 'name', 'symbol', 'is_active', 'is_default', 'conversion_rate_to_usd']
-    list_filter = ['is_active', 'is_default']
+    list_display = ('code', 'name', 'symbol', 'is_active', 'is_default', 'conversion_rate_to_usd')
+    list_filter = ('is_active', 'is_default')
     search_fields = ['code', 'name']
 
 
 @admin.register(PaymentTransaction)
 class PaymentTransactionAdmin(admin.ModelAdmin):
-    list_display = ['provider', 'provider_payment_id', 'purchase', 'amount', 'currency', 'status', 'created_at']
-    list_filter = ['provider', 'status', 'currency']
+    list_display = ('provider', 'provider_payment_id', 'purchase', 'amount', 'currency', 'status', 'created_at')
+    list_filter = ('provider', 'status', 'currency')
     search_fields = ['provider_payment_id', 'idempotency_key']
 
 
 @admin.register(RefundRequest)
 class RefundRequestAdmin(admin.ModelAdmin):
-    list_display = ['purchase', 'amount', 'status', 'requested_by', 'approved_by', 'created_at', 'processed_at']
-    list_filter = ['status', 'created_at']
+    list_display = ('purchase', 'amount', 'status', 'requested_by', 'approved_by', 'created_at', 'processed_at')
+    list_filter = ('status', 'created_at')
     search_fields = ['purchase__id', 'provider_refund_id', 'reason']
 
 
 @admin.register(Invoice)
 class InvoiceAdmin(admin.ModelAdmin):
-    list_display = ['invoice_number', 'purchase', 'amount', 'currency', 'issued_at']
+    list_display = ('invoice_number', 'purchase', 'amount', 'currency', 'issued_at')
     search_fields = ['invoice_number', 'purchase__id']
 
 
 @admin.register(TeacherPayout)
 class TeacherPayoutAdmin(admin.ModelAdmin):
-    list_display = ['teacher', 'period_start', 'period_end', 'amount', 'currency', 'status']
-    list_filter = ['status', 'currency']
+    list_display = ('teacher', 'period_start', 'period_end', 'amount', 'currency', 'status')
+    list_filter = ('status', 'currency')
 
 
 @admin.register(PartnerProfile)
 class PartnerProfileAdmin(admin.ModelAdmin):
-    list_display = ['partner_name', 'user', 'region', 'commission_rate', 'is_active']
-    list_filter = ['is_active', 'region']
+    list_display = ('partner_name', 'user', 'region', 'commission_rate', 'is_active')
+    list_filter = ('is_active', 'region')
     search_fields = ['partner_name', 'user__username']
 
 
 @admin.register(PartnerCourseSale)
 class PartnerCourseSaleAdmin(admin.ModelAdmin):
-    list_display = ['partner', 'purchase', 'commission_amount', 'region', 'created_at']
-    list_filter = ['region']
+    list_display = ('partner', 'purchase', 'commission_amount', 'region', 'created_at')
+    list_filter = ('region',)
 
 
 @admin.register(StudentTeacherNote)
 class StudentTeacherNoteAdmin(admin.ModelAdmin):
-    list_display = ['teacher', 'student', 'course', 'updated_at']
+    list_display = ('teacher', 'student', 'course', 'updated_at')
     search_fields = ['teacher__username', 'student__username', 'course__name']
 
 
 @admin.register(CourseBadge)
 class CourseBadgeAdmin(admin.ModelAdmin):
-    list_display = ['course', 'badge_type', 'is_active', 'starts_at', 'ends_at']
-    list_filter = ['badge_type', 'is_active']
+    list_display = ('course', 'badge_type', 'is_active', 'starts_at', 'ends_at')
+    list_filter = ('badge_type', 'is_active')
 
 
 @admin.register(VideoAccessToken)
 class VideoAccessTokenAdmin(admin.ModelAdmin):
-    list_display = ['lesson', 'user', 'expires_at', 'created_at']
-    list_filter = ['expires_at']
+    list_display = ('lesson', 'user', 'expires_at', 'created_at')
+    list_filter = ('expires_at',)
     search_fields = ['token', 'user__username', 'lesson__title']
 
 
 @admin.register(CourseReview)
 class CourseReviewAdmin(admin.ModelAdmin):
-    list_display = ['course', 'user', 'rating', 'status', 'created_at']
-    list_filter = ['status', 'rating']
+    list_display = ('course', 'user', 'rating', 'status', 'created_at')
+    list_filter = ('status', 'rating')
 
 
 @admin.register(TeacherReview)
 class TeacherReviewAdmin(admin.ModelAdmin):
-    list_display = ['teacher', 'user', 'rating', 'status', 'created_at']
-    list_filter = ['status', 'rating']
+    list_display = ('teacher', 'user', 'rating', 'status', 'created_at')
+    list_filter = ('status', 'rating')
 
 
 @admin.register(Voucher)
 class VoucherAdmin(admin.ModelAdmin):
-    list_display = ['code', 'discount_type', 'discount_value', 'usage_limit', 'used_count', 'is_active', 'campaign']
-    list_filter = ['discount_type', 'is_active', 'campaign']
+    list_display = ('code', 'discount_type', 'discount_value', 'usage_limit', 'used_count', 'is_active', 'campaign')
+    list_filter = ('discount_type', 'is_active', 'campaign')
     search_fields = ['code', 'campaign']
 
 
 @admin.register(VoucherRedemption)
 class VoucherRedemptionAdmin(admin.ModelAdmin):
-    list_display = ['voucher', 'user', 'purchase', 'discounted_amount', 'created_at']
-    list_filter = ['voucher']
+    list_display = ('voucher', 'user', 'purchase', 'discounted_amount', 'created_at')
+    list_filter = ('voucher',)
 
 
 @admin.register(CheckoutOffer)
 class CheckoutOfferAdmin(admin.ModelAdmin):
-    list_display = ['title', 'offer_type', 'trigger_course', 'target_course', 'discount_percent', 'is_active']
-    list_filter = ['offer_type', 'is_active']
+    list_display = ('title', 'offer_type', 'trigger_course', 'target_course', 'discount_percent', 'is_active')
+    list_filter = ('offer_type', 'is_active')
 
 
 @admin.register(NotificationTemplate)
 class NotificationTemplateAdmin(admin.ModelAdmin):
-    list_display = ['event_key', 'channel', 'is_active', 'updated_at']
-    list_filter = ['channel', 'is_active']
+    list_display = ('event_key', 'channel', 'is_active', 'updated_at')
+    list_filter = ('channel', 'is_active')
 
 
 @admin.register(NotificationEvent)
 class NotificationEventAdmin(admin.ModelAdmin):
-    list_display = ['event_key', 'user', 'status', 'created_at', 'processed_at']
-    list_filter = ['status', 'event_key']
+    list_display = ('event_key', 'user', 'status', 'created_at', 'processed_at')
+    list_filter = ('status', 'event_key')
 
 
 @admin.register(EmailSequenceRule)
 class EmailSequenceRuleAdmin(admin.ModelAdmin):
-    list_display = ['trigger_key', 'delay_minutes', 'is_active', 'template']
-    list_filter = ['is_active']
+    list_display = ('trigger_key', 'delay_minutes', 'is_active', 'template')
+    list_filter = ('is_active',)
 
 
 @admin.register(EmailSequenceLog)
 class EmailSequenceLogAdmin(admin.ModelAdmin):
-    list_display = ['rule', 'user', 'status', 'created_at', 'sent_at']
-    list_filter = ['status']
+    list_display = ('rule', 'user', 'status', 'created_at', 'sent_at')
+    list_filter = ('status',)
 
 
 @admin.register(PlacementTest)
 class PlacementTestAdmin(admin.ModelAdmin):
-    list_display = ['name', 'is_active', 'created_at']
-    list_filter = ['is_active']
+    list_display = ('name', 'is_active', 'created_at')
+    list_filter = ('is_active',)
 
 
 @admin.register(PlacementQuestion)
 class PlacementQuestionAdmin(admin.ModelAdmin):
-    list_display = ['test', 'order', 'question_type', 'difficulty']
-    list_filter = ['question_type', 'difficulty']
+    list_display = ('test', 'order', 'question_type', 'difficulty')
+    list_filter = ('question_type', 'difficulty')
 
 
 @admin.register(PlacementAttempt)
 class PlacementAttemptAdmin(admin.ModelAdmin):
-    list_display = ['user', 'test', 'score', 'level', 'recommended_course', 'created_at']
-    list_filter = ['level', 'test']
+    list_display = ('user', 'test', 'score', 'level', 'recommended_course', 'created_at')
+    list_filter = ('level', 'test')
 
 
 @admin.register(FAQItem)
 class FAQItemAdmin(admin.ModelAdmin):
-    list_display = ['question', 'language', 'is_active', 'order']
-    list_filter = ['is_active', 'language']
+    list_display = ('question', 'language', 'is_active', 'order')
+    list_filter = ('is_active', 'language')
 
 
 @admin.register(SocialLink)
 class SocialLinkAdmin(admin.ModelAdmin):
-    list_display = ['platform', 'location', 'url', 'is_active', 'order']
-    list_filter = ['location', 'is_active']
+    list_display = ('platform', 'location', 'url', 'is_active', 'order')
+    list_filter = ('location', 'is_active')
 
 
 @admin.register(AnalyticsEvent)
 class AnalyticsEventAdmin(admin.ModelAdmin):
-    list_display = ['event_name', 'user', 'session_key', 'campaign', 'created_at']
-    list_filter = ['event_name', 'campaign']
+    list_display = ('event_name', 'user', 'session_key', 'campaign', 'created_at')
+    list_filter = ('event_name', 'campaign')
     search_fields = ['event_name', 'session_key', 'campaign']
 
 
 @admin.register(TeacherAvailability)
 class TeacherAvailabilityAdmin(admin.ModelAdmin):
-    list_display = ['teacher', 'weekday', 'start_time', 'end_time', 'timezone_name', 'is_active']
-    list_filter = ['weekday', 'is_active', 'timezone_name']
+    list_display = ('teacher', 'weekday', 'start_time', 'end_time', 'timezone_name', 'is_active')
+    list_filter = ('weekday', 'is_active', 'timezone_name')
 
 
 @admin.register(BookingChangeRequest)
 class BookingChangeRequestAdmin(admin.ModelAdmin):
-    list_display = ['booking', 'request_type', 'requested_by', 'status', 'requested_datetime', 'created_at']
-    list_filter = ['request_type', 'status']
+    list_display = ('booking', 'request_type', 'requested_by', 'status', 'requested_datetime', 'created_at')
+    list_filter = ('request_type', 'status')
+
+
+_register_changelist_invalidation(Course, Bundle, LearningPath)
 
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from myApp.models import Certification, StudentCourseStats, UserProgress
+
+
+class Command(BaseCommand):
+    help = 'Backfill the StudentCourseStats rollup from progress and certification data'
+
+    def handle(self, *args, **options):
+        pairs = set(
+            UserProgress.objects.values_list('user_id', 'lesson__course_id')
+        ) | set(
+            Certification.objects.values_list('user_id', 'course_id')
+        )
+
+        for user_id, course_id in pairs:
+            StudentCourseStats.refresh_for(user_id, course_id)
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed stats for {len(pairs)} student/course pairs'))
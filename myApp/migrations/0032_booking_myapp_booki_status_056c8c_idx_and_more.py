@@ -0,0 +1,35 @@
+# Generated by Django 5.2.17 on 2026-08-29 16:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myApp', '0031_alter_course_course_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'booked_at'], name='myApp_booki_status_056c8c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['status', '-issued_at'], name='myApp_certi_status_f91573_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['-created_at'], name='myApp_certi_created_1ef49a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='courseaccess',
+            index=models.Index(fields=['-granted_at'], name='myApp_cours_granted_bf4246_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursepurchase',
+            index=models.Index(fields=['-created_at'], name='myApp_cours_created_f95572_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-29 16:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myApp', '0032_booking_myapp_booki_status_056c8c_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='learningpathcourse',
+            index=models.Index(fields=['learning_path', 'order'], name='myApp_learn_learnin_465faa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lesson',
+            index=models.Index(fields=['course', 'order'], name='myApp_lesso_course__1de1a5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='livesession',
+            index=models.Index(fields=['scheduled_at'], name='myApp_lives_schedul_81bb98_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='module',
+            index=models.Index(fields=['course', 'order'], name='myApp_modul_course__31e3a9_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.17 on 2026-08-29 16:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myApp', '0034_studentcoursestats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['-issued_at'], name='myApp_certi_issued__7411d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='courseaccess',
+            index=models.Index(fields=['status', 'course'], name='myApp_cours_status_b6964c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='courseenrollment',
+            index=models.Index(fields=['enrolled_at'], name='myApp_cours_enrolle_b8db96_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examattempt',
+            index=models.Index(fields=['-started_at'], name='myApp_exama_started_2457fe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprogress',
+            index=models.Index(fields=['user', 'completed', 'completed_at'], name='myApp_userp_user_id_7da656_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprogress',
+            index=models.Index(fields=['-completed_at'], name='myApp_userp_complet_94e646_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprogress',
+            index=models.Index(fields=['-last_accessed'], name='myApp_userp_last_ac_26a16a_idx'),
+        ),
+    ]
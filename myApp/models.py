@@ -131,10 +131,13 @@ class Module(models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     order = models.IntegerField(default=0)
-    
+
     class Meta:
         ordering = ['order', 'id']
-    
+        indexes = [
+            models.Index(fields=['course', 'order']),
+        ]
+
     def __str__(self):
         return f"{self.course.name} - {self.name}"
 
@@ -217,6 +220,9 @@ class Lesson(models.Model):
     class Meta:
         ordering = ['order', 'id']
         unique_together = ['course', 'slug']
+        indexes = [
+            models.Index(fields=['course', 'order']),
+        ]
     
     def __str__(self):
         return f"{self.course.name} - {self.title}"
@@ -342,6 +348,11 @@ class UserProgress(models.Model):
     class Meta:
         unique_together = ['user', 'lesson']
         ordering = ['-last_accessed']
+        indexes = [
+            models.Index(fields=['user', 'completed', 'completed_at']),
+            models.Index(fields=['-completed_at']),
+            models.Index(fields=['-last_accessed']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.lesson.title}"
@@ -373,7 +384,10 @@ class CourseEnrollment(models.Model):
     
     class Meta:
         unique_together = ['user', 'course']
-    
+        indexes = [
+            models.Index(fields=['enrolled_at']),
+        ]
+
     def __str__(self):
         return f"{self.user.username} - {self.course.name}"
     
@@ -474,7 +488,10 @@ class ExamAttempt(models.Model):
     
     class Meta:
         ordering = ['-started_at']
-    
+        indexes = [
+            models.Index(fields=['-started_at']),
+        ]
+
     def __str__(self):
         status = "Passed" if self.passed else "Failed"
         return f"{self.user.username} - {self.exam.course.name} - Attempt {self.attempt_number()} - {status}"
@@ -521,10 +538,64 @@ class Certification(models.Model):
     class Meta:
         unique_together = ['user', 'course']
         ordering = ['-issued_at', '-created_at']
-    
+        indexes = [
+            models.Index(fields=['status', '-issued_at']),
+            models.Index(fields=['-issued_at']),
+            models.Index(fields=['-created_at']),
+        ]
+
     def __str__(self):
         return f"{self.user.username} - {self.course.name} - {self.get_status_display()}"
 
+
+class StudentCourseStats(models.Model):
+    """Denormalized per-student/course progress rollup.
+
+    Kept current by signals on UserProgress and Certification so dashboards
+    can read one indexed row per student/course instead of re-aggregating
+    lifetime progress on every page view. Backfill existing data with the
+    refresh_student_course_stats management command.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='course_stats')
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='student_stats')
+    total_lessons = models.PositiveIntegerField(default=0)
+    completed_lessons = models.PositiveIntegerField(default=0)
+    has_certification = models.BooleanField(default=False)
+    last_activity = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['user', 'course']
+        indexes = [
+            models.Index(fields=['course', '-completed_lessons']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.course.name} - {self.completed_lessons}/{self.total_lessons}"
+
+    @classmethod
+    def refresh_for(cls, user_id, course_id):
+        """Recompute one (user, course) row from the source tables."""
+        from django.db.models import Count, Max, Q
+        progress = UserProgress.objects.filter(
+            user_id=user_id, lesson__course_id=course_id
+        ).aggregate(
+            completed=Count('id', filter=Q(completed=True)),
+            last_activity=Max('last_accessed'),
+        )
+        cls.objects.update_or_create(
+            user_id=user_id,
+            course_id=course_id,
+            defaults={
+                'total_lessons': Lesson.objects.filter(course_id=course_id).count(),
+                'completed_lessons': progress['completed'],
+                'has_certification': Certification.objects.filter(
+                    user_id=user_id, course_id=course_id, status='passed'
+                ).exists(),
+                'last_activity': progress['last_activity'],
+            },
+        )
+
 # ========== ACCESS CONTROL SYSTEM ==========
 
 class Cohort(models.Model):
@@ -681,6 +752,8 @@ class CourseAccess(models.Model):
         indexes = [
             models.Index(fields=['user', 'course', 'status']),
             models.Index(fields=['status', 'expires_at']),
+            models.Index(fields=['status', 'course']),
+            models.Index(fields=['-granted_at']),
         ]
     
     def __str__(self):
@@ -741,6 +814,7 @@ class CoursePurchase(models.Model):
             models.Index(fields=['user', 'course', 'status']),
             models.Index(fields=['status', 'paid_at']),
             models.Index(fields=['provider', 'provider_id']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -844,6 +918,7 @@ class LiveSession(models.Model):
         indexes = [
             models.Index(fields=['course', 'status', 'scheduled_at']),
             models.Index(fields=['status', 'scheduled_at']),
+            models.Index(fields=['scheduled_at']),
         ]
     
     def __str__(self):
@@ -906,6 +981,7 @@ class Booking(models.Model):
         indexes = [
             models.Index(fields=['user', 'session']),
             models.Index(fields=['session', 'status']),
+            models.Index(fields=['status', 'booked_at']),
         ]
     
     def __str__(self):
@@ -973,6 +1049,9 @@ class LearningPathCourse(models.Model):
     class Meta:
         ordering = ['order']
         unique_together = ['learning_path', 'course']
+        indexes = [
+            models.Index(fields=['learning_path', 'order']),
+        ]
     
     def __str__(self):
         return f"{self.learning_path.name} - {self.course.name} (#{self.order})"
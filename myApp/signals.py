@@ -2,7 +2,8 @@
 Auto-linking signals for CRM Lead Management
 Automatically links enrollments and gifts to leads based on email/user matching
 """
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from .models import (
@@ -10,11 +11,16 @@ from .models import (
     LeadTimeline,
     LeadEnrollmentLink,
     LeadGiftLink,
+    Certification,
+    Course,
     CourseEnrollment,
     GiftPurchase,
     LiveSession,
     CoursePurchase,
     NotificationEvent,
+    StudentCourseStats,
+    TeacherRequest,
+    UserProgress,
 )
 from .services.notifications import queue_notification
 from .services.automation import queue_sequence
@@ -150,6 +156,59 @@ def create_bookings_when_live_session_created(sender, instance, created, **kwarg
     )
 
 
+def _progress_course_id(instance):
+    """Resolve the course without instance.lesson: on cascade deletes the
+    lesson row may already be gone."""
+    from .models import Lesson
+    return Lesson.objects.filter(id=instance.lesson_id).values_list('course_id', flat=True).first()
+
+
+@receiver(post_save, sender=UserProgress)
+def refresh_stats_on_progress_save(sender, instance, created, **kwargs):
+    """Keep the StudentCourseStats rollup current with lesson progress.
+
+    Video playback pings save an incomplete UserProgress row every few
+    seconds, so that path must stay cheap: ``completed`` never reverts once
+    set, meaning an incomplete save can only move ``last_activity`` — a
+    single UPDATE against the existing rollup row. Everything else (first
+    save for a pair, completion flips) takes the full recompute.
+    """
+    course_id = _progress_course_id(instance)
+    if not course_id:
+        return
+    if not created and not instance.completed:
+        updated = StudentCourseStats.objects.filter(
+            user_id=instance.user_id, course_id=course_id
+        ).update(last_activity=instance.last_accessed, updated_at=timezone.now())
+        if updated:
+            return
+    StudentCourseStats.refresh_for(instance.user_id, course_id)
+
+
+@receiver(post_delete, sender=UserProgress)
+def refresh_stats_on_progress_delete(sender, instance, **kwargs):
+    """Recompute the StudentCourseStats rollup when progress rows go away."""
+    course_id = _progress_course_id(instance)
+    if course_id:
+        StudentCourseStats.refresh_for(instance.user_id, course_id)
+
+
+@receiver(post_save, sender=Certification)
+@receiver(post_delete, sender=Certification)
+def refresh_stats_on_certification_change(sender, instance, **kwargs):
+    """Keep the StudentCourseStats certification flag current."""
+    StudentCourseStats.refresh_for(instance.user_id, instance.course_id)
+
+
+@receiver(post_save, sender=TeacherRequest)
+@receiver(post_delete, sender=TeacherRequest)
+@receiver(m2m_changed, sender=Course.teachers.through)
+def invalidate_teacher_list_cache(sender, **kwargs):
+    """Drop the cached teacher dropdown list when eligibility can change."""
+    from .utils.teacher import TEACHER_LIST_CACHE_KEY
+    cache.delete(TEACHER_LIST_CACHE_KEY)
+
+
 @receiver(post_save, sender=CoursePurchase)
 def purchase_event_signal(sender, instance, created, **kwargs):
     """Event hooks for payment and lifecycle automations."""
@@ -22,6 +22,7 @@ from .utils.teacher import (
     is_teacher, is_course_teacher, require_course_teacher, get_teacher_courses,
     get_teacher_course_scope, require_session_teacher, require_booking_teacher,
     get_eligible_course_teacher_users,
+    get_eligible_course_teacher_users_cached,
 )
 
 
@@ -402,7 +403,7 @@ def teacher_add_course(request):
         messages.success(request, f'Course "{course.name}" has been created successfully.')
         return redirect('teacher_course_detail', course_slug=course.slug)
     
-    potential_teachers = get_eligible_course_teacher_users()
+    potential_teachers = get_eligible_course_teacher_users_cached()
     
     return render(request, 'teacher/add_course.html', {
         'course_type_options': _course_type_options(),
@@ -457,7 +458,7 @@ def teacher_course_detail(request, course_slug):
         messages.success(request, 'Course updated successfully.')
         return redirect('teacher_course_detail', course_slug=course.slug)
     
-    potential_teachers = get_eligible_course_teacher_users()
+    potential_teachers = get_eligible_course_teacher_users_cached()
     
     return render(request, 'teacher/course_detail.html', {
         'course': course,
@@ -1,12 +1,16 @@
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from myApp.models import (
+    Bundle,
     Course,
     FeatureFlag,
     SystemSetting,
     Language,
+    LearningPath,
     PlacementTest,
     PlacementQuestion,
     Voucher,
@@ -80,3 +84,42 @@ class RolloutFoundationTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertTrue(SystemSetting.objects.filter(key="email.rules.default_sender").exists())
 
+
+class AdminChangeListQueryTests(TestCase):
+    """Lock in the aggregated-count change lists: query count must not grow with rows."""
+
+    # Ceiling covering auth/session/filter/count/result queries; a per-row
+    # courses.count() regression adds one query per listed object (10 here)
+    # and blows straight past it.
+    MAX_CHANGELIST_QUERIES = 20
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username="root", password="pass12345", is_staff=True, is_superuser=True)
+        self.client.login(username="root", password="pass12345")
+        courses = [
+            Course.objects.create(
+                name=f"Course {i}",
+                slug=f"course-{i}",
+                description="desc",
+                short_description="short",
+            )
+            for i in range(10)
+        ]
+        for i in range(10):
+            bundle = Bundle.objects.create(name=f"Bundle {i}", slug=f"bundle-{i}", price=10)
+            bundle.courses.set(courses)
+            path = LearningPath.objects.create(name=f"Path {i}")
+            path.courses.set(courses)
+
+    def assert_bounded_queries(self, url_name):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(captured), self.MAX_CHANGELIST_QUERIES)
+
+    def test_bundle_changelist_uses_aggregated_counts(self):
+        self.assert_bounded_queries("admin:myApp_bundle_changelist")
+
+    def test_learning_path_changelist_uses_aggregated_counts(self):
+        self.assert_bounded_queries("admin:myApp_learningpath_changelist")
+
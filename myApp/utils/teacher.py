@@ -3,10 +3,13 @@ Teacher Permission Utilities
 Core concept: Teachers can only manage courses they own/teach
 """
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 from django.db.models import Q
 from ..models import Course, LiveSession, Booking, TeacherProfile, TeacherRequest
 
+TEACHER_LIST_CACHE_KEY = 'teachers:list:v1'
+
 
 def get_eligible_course_teacher_users():
     """
@@ -20,6 +23,24 @@ def get_eligible_course_teacher_users():
     ).distinct().order_by('username')
 
 
+def get_eligible_course_teacher_users_cached():
+    """
+    Cached list variant of get_eligible_course_teacher_users() for rendering dropdowns.
+    The list changes rarely (teacher approval / course assignment), so a short TTL avoids
+    re-running the DISTINCT join on every page load. POST validation paths should keep
+    using the live queryset. Invalidated from signals when teacher data changes.
+    """
+    return cache.get_or_set(
+        TEACHER_LIST_CACHE_KEY,
+        lambda: list(
+            get_eligible_course_teacher_users().only(
+                'id', 'username', 'first_name', 'last_name', 'email'
+            )
+        ),
+        300,
+    )
+
+
 def is_teacher(user):
     """Check if user is a teacher (has at least one course assigned)"""
     if not user.is_authenticated:
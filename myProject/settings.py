@@ -56,6 +56,7 @@ CSRF_TRUSTED_ORIGINS = list(dict.fromkeys(combined_origins))
 # Application definition
 
 INSTALLED_APPS = [
+    'admin_auto_filters',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -118,10 +119,13 @@ if not DATABASE_URL:
         "Set it in your .env or environment (e.g. Railway connection URL)."
     )
 
+# Persistent connections amortize the per-query connect handshake across
+# requests (important for query-count-heavy admin/dashboard pages). Set
+# DB_CONN_MAX_AGE=0 when running behind a pooler like pgbouncer.
 DATABASES = {
     'default': dj_database_url.config(
         default=DATABASE_URL,
-        conn_max_age=600,
+        conn_max_age=int(os.getenv('DB_CONN_MAX_AGE', '600')),
         conn_health_checks=True,
     )
 }
@@ -47,6 +47,8 @@ urlpatterns = [
     
     # Dashboard URLs (Admin-facing, for developers)
     path('dashboard/', dashboard_views.dashboard_home, name='dashboard_home'),
+    path('dashboard/partials/activity/', dashboard_views.dashboard_home_activity_partial, name='dashboard_home_activity_partial'),
+    path('dashboard/partials/trend/', dashboard_views.dashboard_home_trend_partial, name='dashboard_home_trend_partial'),
     path('dashboard/analytics/', dashboard_views.dashboard_analytics, name='dashboard_analytics'),
     path('dashboard/settings/', dashboard_views.dashboard_site_settings, name='dashboard_site_settings'),
     path('dashboard/user-management/', dashboard_views.dashboard_user_management, name='dashboard_user_management'),
@@ -58,6 +60,7 @@ urlpatterns = [
     path('dashboard/courses/<slug:course_slug>/sample-certificate/', dashboard_views.dashboard_sample_certificate, name='dashboard_sample_certificate'),
     path('dashboard/courses/<slug:course_slug>/edit-certificate-template/', dashboard_views.dashboard_edit_certificate_template, name='dashboard_edit_certificate_template'),
     path('dashboard/api/ai-generation-status/<int:course_id>/', dashboard_views.api_ai_generation_status, name='api_ai_generation_status'),
+    path('dashboard/api/quiz-ai-status/<int:quiz_id>/', dashboard_views.api_quiz_ai_status, name='api_quiz_ai_status'),
     path('dashboard/courses/<slug:course_slug>/upload-pdf/', views.upload_pdf_lessons, name='dashboard_upload_pdf_lessons'),
     path('dashboard/courses/<slug:course_slug>/clear-lessons/', views.clear_course_lessons, name='dashboard_clear_course_lessons'),
     path('dashboard/lessons/', dashboard_views.dashboard_lessons, name='dashboard_lessons'),